@@ -32,9 +32,31 @@ Exit codes:
 
 import argparse
 import csv
+import itertools
 import sys
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    # Without NumPy (or pyarrow) traces are compared row by row in Python.
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    # pandas is only used to coerce malformed numeric columns in one pass.
+    pd = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    # pyarrow only speeds up trace loading; stream_compare gives the same
+    # report with the csv module.
+    pa = None
+
 
 # ---------------------------------------------------------------------------
 # Color output helpers (for terminal readability)
@@ -72,30 +94,259 @@ CATEGORY_FIELDS = ['moe_action']
 # the C++ golden model and the RTL implementation
 DEFAULT_TOLERANCE = 0.01
 
+# Every column the verifier reads; anything else in a trace is skipped
+TRACE_FIELDS = EXACT_FIELDS + APPROX_FIELDS + CATEGORY_FIELDS + ['stock']
 
-def load_trace(path: str) -> list:
-    """
-    Load a trace CSV file into a list of dicts.
-    Strips whitespace from all field names and values.
-    """
+# Display names for moe_action values
+ACTION_NAMES = {0: 'HOLD', 1: 'BUY', 2: 'SELL'}
+
+# At most this many mismatching orders are kept for the report, so memory
+# stays bounded even when a large trace mismatches everywhere
+MAX_DETAILS = 1000
+
+# Orders per batch when verify() reads traces through pyarrow
+TRACE_BATCH_ROWS = 1 << 14
+
+
+def _require_file(path: str):
+    """Exit with code 2 if a trace file does not exist."""
     if not Path(path).exists():
         print(colored(f"ERROR: File not found: {path}", Colors.RED))
         sys.exit(2)
 
-    with open(path, 'r') as f:
-        reader = csv.DictReader(f)
-        # Normalize column names
-        reader.fieldnames = [name.strip() for name in reader.fieldnames]
-        rows = []
-        for row in reader:
-            cleaned = {k.strip(): v.strip() for k, v in row.items()}
-            rows.append(cleaned)
-    return rows
+
+def _trace_columns(header: list) -> dict:
+    """
+    Stripped field name -> column position, for the TRACE_FIELDS columns in
+    a trace header. A name that repeats maps to its last column, as with
+    csv.DictReader. A trace with none of the fields keeps its first column,
+    so its orders are still counted.
+    """
+    wanted = {
+        name.strip(): i for i, name in enumerate(header)
+        if name.strip() in TRACE_FIELDS
+    }
+    return wanted or {name.strip(): 0 for name in header[:1]}
+
+
+def _arrow_read_options(header: list, wanted: dict):
+    """
+    pyarrow read options naming each wanted column by its stripped field
+    name and every other column by its position, so a repeated header name
+    selects the same column as _trace_columns.
+    """
+    column_names = [f'column {i}' for i in range(len(header))]
+    for name, i in wanted.items():
+        column_names[i] = name
+    return pacsv.ReadOptions(column_names=column_names, skip_rows=1)
+
+
+def _arrow_convert_options(names):
+    """pyarrow convert options reading the given columns as plain strings."""
+    return pacsv.ConvertOptions(
+        include_columns=list(names),
+        column_types={name: pa.string() for name in names},
+        strings_can_be_null=False,
+    )
+
+
+def _arrow_columns(table) -> dict:
+    """Whitespace-stripped NumPy string columns of a pyarrow table."""
+    return {
+        name: pc.utf8_trim_whitespace(table.column(name)).to_numpy(zero_copy_only=False)
+        for name in table.column_names
+    }
+
+
+def iter_trace_batches(path: str, batch_rows: int = TRACE_BATCH_ROWS):
+    """
+    Yield a trace file as consecutive dicts of columns (field name -> NumPy
+    array of string values, one per order) of batch_rows orders each; the
+    last one may be shorter. Only the TRACE_FIELDS columns are kept, or just
+    the first column when the trace has none of them; a repeated field name
+    reads its last column. Field names and values are stripped of
+    whitespace.
+
+    Uses pyarrow's multithreaded C++ CSV reader, so only one batch is held
+    as Python strings at a time. Every column is read as a string, so values
+    compare exactly as they appear in the file. The reader splits the file
+    by byte blocks; its record batches are regrouped into fixed row counts,
+    which keeps the batches of two traces aligned order for order.
+    """
+    _require_file(path)
+    with open(path, 'r', newline='') as f:
+        header = next(csv.reader(f), [])
+    wanted = _trace_columns(header)
+    if not wanted:
+        return
+
+    # Read through a buffered stream rather than a memory map: mapped pages
+    # would stay resident as the file is scanned
+    with pacsv.open_csv(
+        path,
+        read_options=_arrow_read_options(header, wanted),
+        convert_options=_arrow_convert_options(wanted),
+    ) as reader:
+        pending, pending_rows = [], 0
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= batch_rows:
+                table = pa.Table.from_batches(pending, schema=reader.schema)
+                yield _arrow_columns(table.slice(0, batch_rows))
+                rest = table.slice(batch_rows)
+                pending, pending_rows = rest.to_batches(), rest.num_rows
+        if pending_rows:
+            yield _arrow_columns(pa.Table.from_batches(pending, schema=reader.schema))
+
+
+def trace_length(trace: dict) -> int:
+    """Number of orders (rows) in a batch from iter_trace_batches."""
+    return len(next(iter(trace.values()), ()))
+
+
+def _to_float(value: str):
+    """float(value), or None if the value does not parse."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_float_column(col):
+    """
+    Column as a float64 array, plus a mask of values that failed to parse.
+
+    Well-formed columns convert in a single NumPy call. Otherwise the column
+    is coerced in one pass (unparseable cells become NaN) and only the NaN
+    cells are re-checked individually, to tell real parse errors apart from
+    literal 'nan' values.
+    """
+    try:
+        return np.asarray(col, dtype=np.float64), np.zeros(len(col), dtype=bool)
+    except ValueError:
+        pass
+
+    if pd is not None:
+        values = np.asarray(pd.to_numeric(col, errors='coerce'), dtype=np.float64)
+    else:
+        values = np.array([_to_float(v) for v in col], dtype=np.float64)
+
+    bad = np.zeros(len(col), dtype=bool)
+    for i in np.flatnonzero(np.isnan(values)).tolist():
+        value = _to_float(col[i])
+        if value is None:
+            bad[i] = True
+        else:
+            values[i] = value
+    return values, bad
+
+
+def _value_mismatch(kind: str, g_raw: str, h_raw: str, tolerance: float) -> bool:
+    """
+    Whether a single golden/hardware value pair mismatches. Surrounding
+    whitespace is ignored (float() skips it for the numeric kinds).
+    """
+    if kind == 'exact':
+        # Raw cells from stream_compare may carry padding; strip only if the
+        # raw text differs
+        return g_raw != h_raw and g_raw.strip() != h_raw.strip()
+    if kind == 'approx':
+        g_val, h_val = _to_float(g_raw), _to_float(h_raw)
+        return g_val is None or h_val is None or abs(g_val - h_val) > tolerance
+    # Identical text is always the same category; only parse when it differs
+    return g_raw != h_raw and int(float(g_raw)) != int(float(h_raw))
+
+
+def _field_mismatches(kind: str, g_col, h_col, tolerance: float):
+    """
+    Per-row mismatch flags for one field, given equal-length golden and
+    hardware columns. kind is 'exact', 'approx' or 'category'.
+    """
+    if kind == 'exact':
+        return np.asarray(g_col) != np.asarray(h_col)
+    if kind == 'approx':
+        g_val, g_bad = _parse_float_column(g_col)
+        h_val, h_bad = _parse_float_column(h_col)
+        # inf - inf is NaN, which compares as a match, like the scalar check
+        with np.errstate(invalid='ignore'):
+            return g_bad | h_bad | (np.abs(g_val - h_val) > tolerance)
+    # Category values are compared as text first; only the (rare) rows whose
+    # text differs, e.g. '1' vs '1.0', are parsed and compared as integers
+    g_col, h_col = np.asarray(g_col), np.asarray(h_col)
+    flags = g_col != h_col
+    rows = np.flatnonzero(flags)
+    if rows.size:
+        g_val = g_col[rows].astype(np.float64).astype(np.int64)
+        h_val = h_col[rows].astype(np.float64).astype(np.int64)
+        flags[rows] = g_val != h_val
+    return flags
+
+
+def _failing_rows(flag_columns: list, num_rows: int) -> list:
+    """Indices of rows flagged in any of the per-field mismatch columns."""
+    failed = np.zeros(num_rows, dtype=bool)
+    for flags in flag_columns:
+        failed |= flags
+    return np.flatnonzero(failed).tolist()
+
+
+def _describe_mismatch(kind: str, field: str, g_raw: str, h_raw: str, tolerance: float) -> str:
+    """Human-readable description of one mismatching field."""
+    if kind == 'exact':
+        return f"{field}: golden={g_raw} hw={h_raw}"
+    if kind == 'approx':
+        g_val, h_val = _to_float(g_raw), _to_float(h_raw)
+        if g_val is None or h_val is None:
+            return f"{field}: parse error (g='{g_raw}' h='{h_raw}')"
+        return (
+            f"{field}: golden={g_val:.6f} hw={h_val:.6f} "
+            f"(delta={abs(g_val - h_val):.6f} > tol={tolerance})"
+        )
+    g_val, h_val = int(float(g_raw)), int(float(h_raw))
+    return (
+        f"{field}: golden={ACTION_NAMES.get(g_val, g_val)} "
+        f"hw={ACTION_NAMES.get(h_val, h_val)}"
+    )
 
 
-def compare_traces(golden: list, hardware: list, tolerance: float) -> dict:
+def _field_checks(g_fields, h_fields) -> list:
     """
-    Compare golden model trace against hardware trace, field by field.
+    (kind, field) pairs to compare, in report order: exact-match, approximate
+    (floating point), then category fields. Only fields present in both
+    traces are compared.
+    """
+    return [
+        (kind, field)
+        for kind, fields in (
+            ('exact', EXACT_FIELDS),
+            ('approx', APPROX_FIELDS),
+            ('category', CATEGORY_FIELDS),
+        )
+        for field in fields
+        if field in g_fields and field in h_fields
+    ]
+
+
+def _warn_row_count(g_rows: int, h_rows: int):
+    """Warn when the two traces have different numbers of orders."""
+    if g_rows != h_rows:
+        print(colored(
+            f"WARNING: Row count mismatch — golden has {g_rows} rows, "
+            f"hardware has {h_rows} rows",
+            Colors.YELLOW,
+        ))
+
+
+def compare_batch(golden: dict, hardware: dict, tolerance: float,
+                  offset: int = 0, max_details: int = MAX_DETAILS) -> dict:
+    """
+    Compare a golden batch against the matching hardware batch, field by
+    field, up to the length of the shorter one.
+
+    Each field is compared a whole column at a time; per-order detail
+    strings are only built for the orders that actually mismatch, at most
+    max_details of them, numbered from offset.
 
     Returns a dict with:
         - total: number of orders compared
@@ -103,82 +354,138 @@ def compare_traces(golden: list, hardware: list, tolerance: float) -> dict:
         - failed: number of orders with mismatches
         - details: list of mismatch details
     """
-    results = {
-        'total': 0,
-        'passed': 0,
-        'failed': 0,
-        'details': [],
+    num_rows = min(trace_length(golden), trace_length(hardware))
+
+    checks = _field_checks(golden, hardware)
+    flags = [
+        _field_mismatches(kind, golden[field][:num_rows], hardware[field][:num_rows], tolerance)
+        for kind, field in checks
+    ]
+    failing = _failing_rows(flags, num_rows)
+
+    stocks = golden.get('stock')
+    details = []
+    for i in failing[:max_details]:
+        details.append({
+            'order_idx': offset + i,
+            'stock': stocks[i] if stocks is not None else '?',
+            'mismatches': [
+                _describe_mismatch(kind, field, golden[field][i], hardware[field][i], tolerance)
+                for (kind, field), field_flags in zip(checks, flags)
+                if field_flags[i]
+            ],
+        })
+
+    return {
+        'total': num_rows,
+        'passed': num_rows - len(failing),
+        'failed': len(failing),
+        'details': details,
     }
 
-    # Check row counts
-    if len(golden) != len(hardware):
-        print(colored(
-            f"WARNING: Row count mismatch — golden has {len(golden)} rows, "
-            f"hardware has {len(hardware)} rows",
-            Colors.YELLOW,
-        ))
 
-    num_rows = min(len(golden), len(hardware))
+def batch_compare(golden_path: str, hw_path: str, tolerance: float) -> dict:
+    """
+    Compare two trace files batch by batch (see iter_trace_batches), so
+    memory stays bounded by the batch size rather than the trace length.
+    Returns the same dict as compare_batch.
+    """
+    total = failed = g_rows = h_rows = 0
+    details = []
+    batches = itertools.zip_longest(
+        iter_trace_batches(golden_path), iter_trace_batches(hw_path), fillvalue={},
+    )
+    for g_batch, h_batch in batches:
+        g_rows += trace_length(g_batch)
+        h_rows += trace_length(h_batch)
+        result = compare_batch(
+            g_batch, h_batch, tolerance, offset=total, max_details=MAX_DETAILS - len(details),
+        )
+        total += result['total']
+        failed += result['failed']
+        details.extend(result['details'])
+
+    _warn_row_count(g_rows, h_rows)
+
+    return {
+        'total': total,
+        'passed': total - failed,
+        'failed': failed,
+        'details': details,
+    }
 
-    for i in range(num_rows):
-        g = golden[i]
-        h = hardware[i]
-        results['total'] += 1
-        order_ok = True
-        mismatches = []
 
-        # Check exact-match fields
-        for field in EXACT_FIELDS:
-            if field not in g or field not in h:
-                continue
-            g_val = g[field].strip()
-            h_val = h[field].strip()
-            if g_val != h_val:
-                order_ok = False
-                mismatches.append(f"{field}: golden={g_val} hw={h_val}")
-
-        # Check approximate-match fields (floating point)
-        for field in APPROX_FIELDS:
-            if field not in g or field not in h:
-                continue
-            try:
-                g_val = float(g[field])
-                h_val = float(h[field])
-                if abs(g_val - h_val) > tolerance:
-                    order_ok = False
-                    mismatches.append(
-                        f"{field}: golden={g_val:.6f} hw={h_val:.6f} "
-                        f"(delta={abs(g_val - h_val):.6f} > tol={tolerance})"
-                    )
-            except ValueError:
-                order_ok = False
-                mismatches.append(f"{field}: parse error (g='{g[field]}' h='{h[field]}')")
-
-        # Check category fields
-        for field in CATEGORY_FIELDS:
-            if field not in g or field not in h:
+def stream_compare(golden_path: str, hw_path: str, tolerance: float) -> dict:
+    """
+    Compare two trace files in a single streaming pass, without loading
+    either into memory — the pure-Python route for traces too large to
+    materialize. Returns the same dict as compare_batch.
+
+    Column positions are looked up from the headers once; each row is then
+    compared by integer index. Cells are parsed exactly as the csv module
+    does elsewhere and only stripped when their raw text differs or when a
+    mismatch is reported.
+    """
+    _require_file(golden_path)
+    _require_file(hw_path)
+
+    with open(golden_path, 'r', newline='') as gf, open(hw_path, 'r', newline='') as hf:
+        g_reader = csv.reader(gf)
+        h_reader = csv.reader(hf)
+        g_idx = {name.strip(): i for i, name in enumerate(next(g_reader, []))}
+        h_idx = {name.strip(): i for i, name in enumerate(next(h_reader, []))}
+        checks = [
+            (kind, field, g_idx[field], h_idx[field])
+            for kind, field in _field_checks(g_idx, h_idx)
+        ]
+        stock_idx = g_idx.get('stock')
+
+        total = failed = g_extra = h_extra = 0
+        details = []
+        g_rows = (row for row in g_reader if row)
+        h_rows = (row for row in h_reader if row)
+        for g_row, h_row in itertools.zip_longest(g_rows, h_rows):
+            if g_row is None or h_row is None:
+                # Past the end of the shorter trace: just count
+                g_extra += g_row is not None
+                h_extra += h_row is not None
                 continue
-            g_val = int(float(g[field]))
-            h_val = int(float(h[field]))
-            if g_val != h_val:
-                order_ok = False
-                actions = {0: 'HOLD', 1: 'BUY', 2: 'SELL'}
-                mismatches.append(
-                    f"{field}: golden={actions.get(g_val, g_val)} "
-                    f"hw={actions.get(h_val, h_val)}"
-                )
-
-        if order_ok:
-            results['passed'] += 1
-        else:
-            results['failed'] += 1
-            results['details'].append({
-                'order_idx': i,
-                'stock': g.get('stock', '?'),
-                'mismatches': mismatches,
-            })
 
-    return results
+            mismatches = []
+            for kind, field, gi, hi in checks:
+                if _value_mismatch(kind, g_row[gi], h_row[hi], tolerance):
+                    mismatches.append(_describe_mismatch(
+                        kind, field, g_row[gi].strip(), h_row[hi].strip(), tolerance,
+                    ))
+
+            if mismatches:
+                failed += 1
+                if len(details) < MAX_DETAILS:
+                    details.append({
+                        'order_idx': total,
+                        'stock': g_row[stock_idx].strip() if stock_idx is not None else '?',
+                        'mismatches': mismatches,
+                    })
+            total += 1
+
+    _warn_row_count(total + g_extra, total + h_extra)
+
+    return {
+        'total': total,
+        'passed': total - failed,
+        'failed': failed,
+        'details': details,
+    }
+
+
+def verify(golden_path: str, hw_path: str, tolerance: float) -> dict:
+    """
+    Compare two trace files in bounded memory: column-wise in batches when
+    pyarrow and NumPy are available, otherwise streamed row by row.
+    """
+    if pa is None or np is None:
+        return stream_compare(golden_path, hw_path, tolerance)
+    return batch_compare(golden_path, hw_path, tolerance)
 
 
 def print_report(results: dict, golden_path: str, hw_path: str):
@@ -204,6 +511,12 @@ def print_report(results: dict, golden_path: str, hw_path: str):
             ))
             for m in detail['mismatches']:
                 print(colored(f"    - {m}", Colors.RED))
+        if results['failed'] > len(results['details']):
+            print(colored(
+                f"  ... {results['failed'] - len(results['details'])} more "
+                f"mismatching orders not shown",
+                Colors.RED,
+            ))
         print()
 
     # Summary
@@ -243,8 +556,7 @@ def self_test():
         print(colored(f"Self-test skipped: {golden_path} not found", Colors.YELLOW))
         return True
 
-    golden = load_trace(golden_path)
-    results = compare_traces(golden, golden, DEFAULT_TOLERANCE)
+    results = verify(golden_path, golden_path, DEFAULT_TOLERANCE)
 
     if results['failed'] == 0 and results['total'] > 0:
         print(colored(
@@ -278,12 +590,8 @@ def main():
         ok = self_test()
         sys.exit(0 if ok else 1)
 
-    # Load traces
-    golden = load_trace(args.golden)
-    hardware = load_trace(args.hardware)
-
-    # Compare
-    results = compare_traces(golden, hardware, args.tolerance)
+    # Load and compare traces
+    results = verify(args.golden, args.hardware, args.tolerance)
 
     # Report
     print_report(results, args.golden, args.hardware)
@@ -27,16 +27,39 @@ Usage:
 
     # Also produce a human-readable CSV for inspection:
     python3 tools/generate_itch_data.py --synthetic --output data/test_orders.bin --csv data/test_orders.csv
+
+Synthetic generation uses the per-order generator by default, so a given
+--seed always reproduces the same files. Pass --vectorized to generate with
+NumPy instead (much faster, but a different random stream), or --workers N to
+shard the vectorized generator across N processes. Sharded data depends on N,
+but never on the machine it runs on.
 """
 
 import argparse
 import csv
+import operator
 import os
+import queue
 import random
 import struct
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy only powers the vectorized synthetic generator; the pure-Python
+    # path below produces the same kind of data without it.
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    # Only used to format the batch CSV sidecar; csv.writer is the fallback.
+    pd = None
+
 
 # ---------------------------------------------------------------------------
 # ITCH message constants
@@ -47,6 +70,65 @@ STOCK_FIELD_LEN = 8            # Stock symbol is always 8 ASCII bytes
 PRICE_DECIMALS = 4             # ITCH prices have 4 implied decimal places
 PRICE_SCALE = 10 ** PRICE_DECIMALS  # Multiply dollar price by this
 
+# The whole Add Order message as one precompiled big-endian Struct:
+#   B  = 1 byte  (message type)
+#   H  = 2 bytes (stock locate)
+#   H  = 2 bytes (tracking number)
+#   H  = 2 bytes (timestamp, high 16 bits) — the 6-byte timestamp is
+#   I  = 4 bytes (timestamp, low 32 bits)     split so no bytes are built
+#   Q  = 8 bytes (order reference)
+#   c  = 1 byte  (side)
+#   I  = 4 bytes (shares)
+#   8s = 8 bytes (stock)
+#   I  = 4 bytes (price)
+_ITCH = struct.Struct('>BHHHIQcI8sI')
+assert _ITCH.size == ADD_ORDER_SIZE
+
+# Per-message argument checks in pack_add_order are skipped unless ITCH_FAST=0.
+# Without them struct.pack still rejects out-of-range integers, an unknown
+# side fails the _SIDE_BYTES lookup, and symbol length is checked once per
+# symbol when it is first encoded.
+_FAST = os.environ.get('ITCH_FAST', '1') == '1'
+
+# Encoded side/stock fields, cached because the same few values repeat
+# for every order in a run
+_SIDE_BYTES = {'B': b'B', 'S': b'S'}
+_STOCK_BYTES = {}
+
+
+# Columns of the human-readable CSV written alongside the binary file
+CSV_FIELDS = [
+    'order_ref', 'timestamp_ns', 'side', 'shares',
+    'stock', 'price_raw', 'price_dollars',
+]
+
+# NumPy record layout identical to _ITCH (including the split timestamp), so
+# an array of these is a ready-made ITCH byte stream.
+if np is not None:
+    ADD_ORDER_DTYPE = np.dtype([
+        ('type', 'u1'),
+        ('stock_locate', '>u2'),
+        ('tracking_num', '>u2'),
+        ('ts_hi', '>u2'),
+        ('ts_lo', '>u4'),
+        ('order_ref', '>u8'),
+        ('side', 'S1'),
+        ('shares', '>u4'),
+        ('stock', 'S8'),
+        ('price', '>u4'),
+    ])
+    assert ADD_ORDER_DTYPE.itemsize == ADD_ORDER_SIZE
+
+
+def _encode_stock(stock: str) -> bytes:
+    """Return the stock symbol right-padded with spaces to exactly 8 bytes."""
+    stock_bytes = _STOCK_BYTES.get(stock)
+    if stock_bytes is None:
+        assert len(stock) <= STOCK_FIELD_LEN, f"Stock symbol too long: '{stock}'"
+        stock_bytes = stock.encode('ascii').ljust(STOCK_FIELD_LEN, b' ')
+        _STOCK_BYTES[stock] = stock_bytes
+    return stock_bytes
+
 
 def pack_add_order(
     timestamp_ns: int,
@@ -85,48 +167,57 @@ def pack_add_order(
     bytes
         Exactly 36 bytes — one complete ITCH Add Order message.
     """
-    # Validate inputs
-    assert side in ('B', 'S'), f"Side must be 'B' or 'S', got '{side}'"
-    assert 0 <= shares < 2**32, f"Shares out of range: {shares}"
-    assert 0 <= price_raw < 2**32, f"Price out of range: {price_raw}"
-    assert len(stock) <= STOCK_FIELD_LEN, f"Stock symbol too long: '{stock}'"
-
-    # Right-pad stock symbol with spaces to exactly 8 bytes
-    stock_bytes = stock.encode('ascii').ljust(STOCK_FIELD_LEN, b' ')
-
-    # Pack everything in big-endian byte order:
-    #   B  = 1 byte  (message type)
-    #   H  = 2 bytes (stock locate)
-    #   H  = 2 bytes (tracking number)
-    #   6s = 6 bytes (timestamp — we use manual packing for 6-byte int)
-    #   Q  = 8 bytes (order reference)
-    #   c  = 1 byte  (side)
-    #   I  = 4 bytes (shares)
-    #   8s = 8 bytes (stock)
-    #   I  = 4 bytes (price)
-    ts_bytes = timestamp_ns.to_bytes(6, byteorder='big')
-
-    msg = struct.pack(
-        '>B H H',
+    # Validate inputs (debug runs only, see _FAST)
+    if not _FAST:
+        assert side in ('B', 'S'), f"Side must be 'B' or 'S', got '{side}'"
+        assert 0 <= shares < 2**32, f"Shares out of range: {shares}"
+        assert 0 <= price_raw < 2**32, f"Price out of range: {price_raw}"
+        assert len(stock) <= STOCK_FIELD_LEN, f"Stock symbol too long: '{stock}'"
+
+    # One call on the precompiled Struct builds the final bytes object
+    # directly (packing into a scratch buffer and copying it out is slower)
+    return _ITCH.pack(
         ITCH_ADD_ORDER,
         stock_locate,
         tracking_num,
-    )
-    msg += ts_bytes
-    msg += struct.pack(
-        '>Q c I 8s I',
+        timestamp_ns >> 32,
+        timestamp_ns & 0xFFFFFFFF,
         order_ref,
-        side.encode('ascii'),
+        _SIDE_BYTES[side],
         shares,
-        stock_bytes,
+        _encode_stock(stock),
         price_raw,
     )
 
-    assert len(msg) == ADD_ORDER_SIZE, f"Message size {len(msg)} != {ADD_ORDER_SIZE}"
-    return msg
 
+def make_add_order_packer(stock_locate: int = 0, tracking_num: int = 0):
+    """
+    Return a packer specialized for a fixed stock_locate / tracking_num:
+
+        pack(timestamp_ns, order_ref, side_bytes, shares, stock_bytes, price_raw)
 
-def generate_from_csv(csv_path: str, base_timestamp_ns: int = 34_200_000_000_000):
+    Meant for generator hot loops. It takes already-encoded side and
+    space-padded stock bytes, binds the constant fields and the Struct's
+    pack method as closure variables, and skips pack_add_order's per-call
+    validation. struct.pack still rejects out-of-range integers.
+    """
+    pack = _ITCH.pack
+
+    def pack_fast(timestamp_ns, order_ref, side_bytes, shares, stock_bytes, price_raw):
+        return pack(
+            ITCH_ADD_ORDER, stock_locate, tracking_num,
+            timestamp_ns >> 32, timestamp_ns & 0xFFFFFFFF,
+            order_ref, side_bytes, shares, stock_bytes, price_raw,
+        )
+
+    return pack_fast
+
+
+def generate_from_csv(
+    csv_path: str,
+    base_timestamp_ns: int = 34_200_000_000_000,
+    seed: int = 42,
+):
     """
     Read a CSV of historical prices and generate ITCH Add Order messages.
 
@@ -143,12 +234,20 @@ def generate_from_csv(csv_path: str, base_timestamp_ns: int = 34_200_000_000_000
     base_timestamp_ns : int
         Starting timestamp in nanoseconds. Default is 9:30 AM ET
         (34,200 seconds × 1e9 ns = market open).
+    seed : int
+        Seed for the generator's private random.Random instance.
 
     Yields
     ------
     tuple(bytes, dict)
         The packed binary message and a metadata dict for CSV output.
     """
+    # Bound methods of a private RNG: no global lookups in the loop
+    rnd = random.Random(seed)
+    _choice = rnd.choice
+    _randint = rnd.randint
+    pack = make_add_order_packer()
+
     timestamp_ns = base_timestamp_ns
     order_ref = 1
 
@@ -178,19 +277,15 @@ def generate_from_csv(csv_path: str, base_timestamp_ns: int = 34_200_000_000_000
             if shares_str and shares_str.strip():
                 shares = int(float(shares_str.strip()))
             else:
-                shares = random.choice([100, 200, 300, 500, 1000])
+                shares = _choice([100, 200, 300, 500, 1000])
 
             # Advance timestamp by a realistic inter-arrival time
             # Real ITCH messages arrive ~100ns-10μs apart during active trading
-            timestamp_ns += random.randint(100, 10_000)
-
-            msg = pack_add_order(
-                timestamp_ns=timestamp_ns,
-                order_ref=order_ref,
-                side=side,
-                shares=shares,
-                stock=stock,
-                price_raw=price_raw,
+            timestamp_ns += _randint(100, 10_000)
+
+            msg = pack(
+                timestamp_ns, order_ref, _SIDE_BYTES[side], shares,
+                _encode_stock(stock), price_raw,
             )
 
             metadata = {
@@ -213,6 +308,7 @@ def generate_synthetic(
     base_price: float = 150.0,
     volatility: float = 0.001,
     base_timestamp_ns: int = 34_200_000_000_000,
+    seed: int = 42,
 ):
     """
     Generate synthetic but realistic ITCH order flow using a random walk.
@@ -234,6 +330,8 @@ def generate_synthetic(
         Per-tick price change standard deviation (fraction of price).
     base_timestamp_ns : int
         Starting nanosecond timestamp (default: 9:30 AM market open).
+    seed : int
+        Seed for the generator's private random.Random instance.
 
     Yields
     ------
@@ -243,6 +341,15 @@ def generate_synthetic(
     if symbols is None:
         symbols = ['AAPL', 'GOOG', 'MSFT', 'TSLA', 'AMZN', 'META', 'NVDA', 'AMD']
 
+    # Bound methods of a private RNG: no global lookups in the loop
+    rnd = random.Random(seed)
+    _choice = rnd.choice
+    _gauss = rnd.gauss
+    _randint = rnd.randint
+    _randrange = rnd.randrange
+    _rand = rnd.random
+    pack = make_add_order_packer()
+
     # Track a mid-price per symbol (simulates price discovery)
     prices = {sym: base_price for sym in symbols}
     timestamp_ns = base_timestamp_ns
@@ -251,14 +358,18 @@ def generate_synthetic(
     # Realistic lot sizes (round lots are most common)
     lot_sizes = [100, 100, 100, 200, 200, 300, 500, 1000]
 
+    # Encode (and length-check) each ticker once rather than once per order
+    encoded = [_encode_stock(sym) for sym in symbols]
+
     for i in range(num_orders):
-        # Pick a random symbol
-        stock = random.choice(symbols)
+        # Pick a random symbol (same draw as rnd.choice(symbols))
+        sym_idx = _randrange(len(symbols))
+        stock = symbols[sym_idx]
 
         # Random walk the price (geometric Brownian motion)
         # This creates realistic price series where changes are proportional
         # to the current price level
-        price_change = random.gauss(0, volatility) * prices[stock]
+        price_change = _gauss(0, volatility) * prices[stock]
         prices[stock] = max(1.0, prices[stock] + price_change)
 
         # Decide buy vs sell (slightly biased by recent price movement)
@@ -266,34 +377,30 @@ def generate_synthetic(
         # If price went down, more likely to see buys (bargain-hunting)
         buy_probability = 0.5 - (price_change / prices[stock]) * 10
         buy_probability = max(0.3, min(0.7, buy_probability))
-        side = 'B' if random.random() < buy_probability else 'S'
+        side = 'B' if _rand() < buy_probability else 'S'
 
         # Price offset from mid: buys below mid, sells above mid
         # This creates a realistic bid-ask spread
-        spread_ticks = random.randint(1, 10)  # 1-10 ticks of spread
+        spread_ticks = _randint(1, 10)  # 1-10 ticks of spread
         if side == 'B':
             order_price = prices[stock] - spread_ticks * 0.01
         else:
             order_price = prices[stock] + spread_ticks * 0.01
 
         price_raw = int(round(order_price * PRICE_SCALE))
-        shares = random.choice(lot_sizes)
+        shares = _choice(lot_sizes)
 
         # Realistic inter-arrival: bursts (100ns) and quiet periods (10μs)
-        if random.random() < 0.2:
+        if _rand() < 0.2:
             # Burst: very fast arrivals (100-500 ns)
-            timestamp_ns += random.randint(100, 500)
+            timestamp_ns += _randint(100, 500)
         else:
             # Normal: typical gap (1μs-10μs)
-            timestamp_ns += random.randint(1_000, 10_000)
-
-        msg = pack_add_order(
-            timestamp_ns=timestamp_ns,
-            order_ref=order_ref,
-            side=side,
-            shares=shares,
-            stock=stock,
-            price_raw=price_raw,
+            timestamp_ns += _randint(1_000, 10_000)
+
+        msg = pack(
+            timestamp_ns, order_ref, _SIDE_BYTES[side], shares,
+            encoded[sym_idx], price_raw,
         )
 
         metadata = {
@@ -310,29 +417,367 @@ def generate_synthetic(
         order_ref += 1
 
 
-def write_output(orders, bin_path: str, csv_path: str = None):
-    """Write generated orders to binary and optionally CSV files."""
-    count = 0
-    csv_writer = None
-    csv_file = None
+def pack_add_order_batch(
+    timestamp_ns,
+    order_ref,
+    side,
+    shares,
+    stock_bytes,
+    price_raw,
+    stock_locate: int = 0,
+    tracking_num: int = 0,
+):
+    """
+    Pack many ITCH Add Order messages at once — the array form of
+    pack_add_order.
+
+    Each argument is a NumPy array with one entry per order (``side`` holds
+    b'B'/b'S', ``stock_bytes`` the space-padded 8-byte symbols). Every field
+    is written with one strided copy into an ADD_ORDER_DTYPE record array,
+    so the byte packing runs in NumPy's C loops with no per-message Python
+    work.
+
+    Returns
+    -------
+    numpy.ndarray
+        ADD_ORDER_DTYPE array; ``.tobytes()`` is the 36-byte-per-order stream.
+    """
+    # Validated once per batch rather than per message
+    assert np.isin(side, [b'B', b'S']).all(), "Side must be b'B' or b'S'"
+    assert ((shares >= 0) & (shares < 2**32)).all(), "Shares out of range"
+    assert ((price_raw >= 0) & (price_raw < 2**32)).all(), "Price out of range"
+    # 6-byte field; ts_hi would otherwise wrap silently
+    assert ((timestamp_ns >= 0) & (timestamp_ns < 2**48)).all(), "Timestamp out of range"
+
+    msgs = np.empty(len(order_ref), dtype=ADD_ORDER_DTYPE)
+    msgs['type'] = ITCH_ADD_ORDER
+    msgs['stock_locate'] = stock_locate
+    msgs['tracking_num'] = tracking_num
+    msgs['ts_hi'] = timestamp_ns >> 32
+    msgs['ts_lo'] = timestamp_ns & 0xFFFFFFFF
+    msgs['order_ref'] = order_ref
+    msgs['side'] = side
+    msgs['shares'] = shares
+    msgs['stock'] = stock_bytes
+    msgs['price'] = price_raw
+    return msgs
+
+
+def _seed_key(seed) -> tuple:
+    """
+    Normalize an int or tuple seed to a tuple of non-negative ints, as
+    NumPy's seeding requires. Negative seeds (accepted by random.Random)
+    are mapped into range with ``% 2**64``.
+    """
+    seeds = seed if isinstance(seed, tuple) else (seed,)
+    return tuple(s % 2**64 for s in seeds)
+
+
+def _arrival_gaps(seed_key: tuple, n: int):
+    """
+    Inter-arrival gaps in ns: bursts (100-500 ns) 20% of the time, otherwise
+    typical 1-10 μs gaps.
+
+    Drawn from their own RNG stream, separate from the price/side/size draws,
+    so the time span of a shard can be computed without generating its
+    orders.
+    """
+    rng = np.random.default_rng([*seed_key, 1])
+    burst = rng.random(n) < 0.2
+    return np.where(burst, rng.integers(100, 501, n), rng.integers(1_000, 10_001, n))
+
+
+def generate_synthetic_batch(
+    num_orders: int = 100,
+    symbols: list = None,
+    base_price: float = 150.0,
+    volatility: float = 0.001,
+    base_timestamp_ns: int = 34_200_000_000_000,
+    seed=42,
+    first_order_ref: int = 1,
+):
+    """
+    Vectorized version of generate_synthetic — all orders in one shot.
+
+    Same model (per-symbol random walk, side biased against the last move,
+    bursty arrivals, round lots), but every random draw is made up front
+    with NumPy and the messages are laid out directly in an ADD_ORDER_DTYPE
+    array. Uses its own RNG stream, so output differs from the pure-Python
+    generator for the same seed.
+
+    ``seed`` may be an int or a tuple of ints (generate_synthetic_parallel
+    passes ``(seed, shard)``); ``first_order_ref`` numbers the first order.
+
+    Returns
+    -------
+    tuple(numpy.ndarray, dict)
+        The packed messages (ADD_ORDER_DTYPE, ``.tobytes()`` is the ITCH
+        stream) and a dict of per-order column arrays keyed by CSV_FIELDS.
+    """
+    if symbols is None:
+        symbols = ['AAPL', 'GOOG', 'MSFT', 'TSLA', 'AMZN', 'META', 'NVDA', 'AMD']
+    for stock in symbols:
+        assert len(stock) <= STOCK_FIELD_LEN, f"Stock symbol too long: '{stock}'"
+
+    n = max(0, num_orders)  # like range(num_orders) in generate_synthetic
+    seed_key = _seed_key(seed)
+    rng = np.random.default_rng([*seed_key, 0])
+    lot_sizes = np.array([100, 100, 100, 200, 200, 300, 500, 1000])
+
+    sym_idx = rng.integers(0, len(symbols), n)
+    # Clamp so log1p stays finite; anything near -1 hits the $1 floor anyway
+    gauss = np.maximum(rng.standard_normal(n) * volatility, -0.999999)
+    side_draw = rng.random(n)
+    spread_ticks = rng.integers(1, 11, n)
+    shares = lot_sizes[rng.integers(0, len(lot_sizes), n)]
+    gaps = _arrival_gaps(seed_key, n)
+
+    # Random walk the mid-price of each symbol. Only a loop over symbols —
+    # within a symbol the walk is a cumulative sum of log returns. The
+    # max(1.0, price) floor becomes a floor at 0 on the log-price, which is
+    # applied exactly by subtracting the running minimum below zero.
+    mid = np.empty(n)
+    prev_mid = np.empty(n)
+    for s in range(len(symbols)):
+        idx = np.flatnonzero(sym_idx == s)
+        if idx.size == 0:
+            continue
+        log_mid = np.log(base_price) + np.cumsum(np.log1p(gauss[idx]))
+        log_mid -= np.minimum(np.minimum.accumulate(log_mid), 0.0)
+        mid[idx] = np.exp(log_mid)
+        prev_mid[idx] = np.concatenate(([base_price], mid[idx][:-1]))
+    price_change = gauss * prev_mid
+
+    # Buy vs sell biased by the move (see generate_synthetic)
+    buy_probability = np.clip(0.5 - (price_change / mid) * 10, 0.3, 0.7)
+    is_buy = side_draw < buy_probability
+
+    # Buys below mid, sells above mid — a signed offset, no masked branches
+    order_price = mid + np.where(is_buy, -1, 1) * spread_ticks * 0.01
+    price_raw = np.rint(order_price * PRICE_SCALE).astype(np.int64)
+
+    timestamp_ns = base_timestamp_ns + np.cumsum(gaps)
+    order_ref = np.arange(first_order_ref, first_order_ref + n, dtype=np.uint64)
+
+    stocks = np.array([_encode_stock(sym) for sym in symbols])
+    msgs = pack_add_order_batch(
+        timestamp_ns=timestamp_ns,
+        order_ref=order_ref,
+        side=np.where(is_buy, b'B', b'S'),
+        shares=shares,
+        stock_bytes=stocks[sym_idx],
+        price_raw=price_raw,
+    )
+
+    columns = {
+        'order_ref': order_ref,
+        'timestamp_ns': timestamp_ns,
+        'side': np.where(is_buy, 'B', 'S'),
+        'shares': shares,
+        'stock': np.array(symbols)[sym_idx],
+        'price_raw': price_raw,
+        'price_dollars': np.round(order_price, 4),
+    }
+    return msgs, columns
+
+
+# Orders staged in memory per write (~1.2 MB of binary messages)
+WRITE_CHUNK_ORDERS = 1 << 15
+
+# Buffer size for the CSV sidecar file
+CSV_BUFFER_SIZE = 1 << 20
+
+
+def _write_csv_columns(columns: dict, csv_path: str):
+    """Write per-order column arrays (keyed by CSV_FIELDS) as the CSV sidecar."""
+    if pd is not None:
+        # One vectorized to_csv call, no per-row Python objects. Default float
+        # formatting and \r\n line endings match the csv-module output.
+        pd.DataFrame(columns, columns=CSV_FIELDS).to_csv(
+            csv_path, index=False, lineterminator='\r\n',
+        )
+    else:
+        with open(csv_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(CSV_FIELDS)
+            csv_writer.writerows(zip(*(columns[f].tolist() for f in CSV_FIELDS)))
+
+
+def write_batch_output(msgs, columns: dict, bin_path: str, csv_path: str = None):
+    """Write a generate_synthetic_batch result to binary and optionally CSV."""
+    with open(bin_path, 'wb') as bf:
+        # The record array already is the ITCH stream — hand its buffer
+        # straight to the file without copying it into a bytes object.
+        bf.write(msgs.data)
 
     if csv_path:
-        csv_file = open(csv_path, 'w', newline='')
-        csv_writer = csv.DictWriter(csv_file, fieldnames=[
-            'order_ref', 'timestamp_ns', 'side', 'shares',
-            'stock', 'price_raw', 'price_dollars',
-        ])
-        csv_writer.writeheader()
+        _write_csv_columns(columns, csv_path)
 
+    return len(msgs)
+
+
+def _shard_span(seed_key: tuple, count: int) -> int:
+    """Total time in ns covered by a shard's arrivals (worker task)."""
+    return int(_arrival_gaps(seed_key, count).sum())
+
+
+def _write_shard(bin_path: str, start: int, count: int, base_timestamp_ns: int,
+                 seed_key: tuple, batch_kwargs: dict, want_columns: bool):
+    """Generate one shard and write it into its slice of the output (worker task)."""
+    msgs, columns = generate_synthetic_batch(
+        num_orders=count,
+        base_timestamp_ns=base_timestamp_ns,
+        seed=seed_key,
+        first_order_ref=start + 1,
+        **batch_kwargs,
+    )
+    with open(bin_path, 'r+b') as bf:
+        bf.seek(start * ADD_ORDER_SIZE)
+        bf.write(msgs.data)
+    return columns if want_columns else None
+
+
+def _shard_count(num_orders: int, workers: int) -> int:
+    """Shards generate_synthetic_parallel splits num_orders into."""
+    return max(1, min(workers, num_orders))
+
+
+def generate_synthetic_parallel(
+    bin_path: str,
+    csv_path: str = None,
+    num_orders: int = 100,
+    symbols: list = None,
+    base_price: float = 150.0,
+    volatility: float = 0.001,
+    base_timestamp_ns: int = 34_200_000_000_000,
+    seed: int = 42,
+    workers: int = 1,
+):
+    """
+    Generate synthetic orders with generate_synthetic_batch across several
+    processes, each writing its shard straight into its slice of bin_path.
+
+    Orders are split into one contiguous shard per worker (at most one per
+    order), each with its own RNG stream. Order reference numbers and
+    timestamps continue across shard boundaries (every shard starts where
+    the previous one's arrivals end), but each shard restarts its price walk
+    at base_price — fine for test data. Output depends on the number of
+    shards, never on the host: the process pool is capped at the CPU count,
+    and a single shard reproduces generate_synthetic_batch exactly.
+
+    Returns the number of orders written.
+    """
+    num_orders = max(0, num_orders)
+    workers = _shard_count(num_orders, workers)
+    bounds = [num_orders * k // workers for k in range(workers + 1)]
+    shards = [
+        (start, end - start, _seed_key((seed, k) if workers > 1 else seed))
+        for k, (start, end) in enumerate(zip(bounds, bounds[1:]))
+    ]
+    batch_kwargs = {'symbols': symbols, 'base_price': base_price, 'volatility': volatility}
+
+    # Size the file up front so shards can be written in any order
     with open(bin_path, 'wb') as bf:
-        for msg_bytes, metadata in orders:
-            bf.write(msg_bytes)
-            if csv_writer:
-                csv_writer.writerow(metadata)
-            count += 1
+        bf.truncate(num_orders * ADD_ORDER_SIZE)
+
+    with ProcessPoolExecutor(max_workers=min(workers, os.cpu_count() or 1)) as pool:
+        spans = list(pool.map(
+            _shard_span,
+            [key for _, _, key in shards],
+            [count for _, count, _ in shards],
+        ))
+        shard_bases = [base_timestamp_ns]
+        for span in spans[:-1]:
+            shard_bases.append(shard_bases[-1] + span)
+
+        futures = [
+            pool.submit(_write_shard, bin_path, start, count, shard_base,
+                        key, batch_kwargs, csv_path is not None)
+            for (start, count, key), shard_base in zip(shards, shard_bases)
+        ]
+        shard_columns = [f.result() for f in futures]
+
+    if csv_path:
+        _write_csv_columns(
+            {f: np.concatenate([c[f] for c in shard_columns]) for f in CSV_FIELDS},
+            csv_path,
+        )
+
+    return num_orders
+
+
+def _csv_worker(row_batches: queue.Queue, csv_path: str, errors: list):
+    """Write batches of metadata rows from a queue until a None sentinel."""
+    try:
+        with open(csv_path, 'w', newline='', buffering=CSV_BUFFER_SIZE) as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(CSV_FIELDS)
+            # itemgetter pulls each row's values in C, unlike DictWriter's
+            # per-row Python conversion
+            row_values = operator.itemgetter(*CSV_FIELDS)
+            for rows in iter(row_batches.get, None):
+                csv_writer.writerows(map(row_values, rows))
+    except Exception as exc:
+        errors.append(exc)
+        # Keep draining so the producer never blocks on a full queue
+        for _ in iter(row_batches.get, None):
+            pass
+
+
+def write_output(orders, bin_path: str, csv_path: str = None):
+    """
+    Write generated orders to binary and optionally CSV files.
 
-    if csv_file:
-        csv_file.close()
+    CSV rows are formatted on a background thread, so packing and binary
+    writes aren't held up by per-row CSV formatting.
+    """
+    count = 0
+    csv_rows = []
+    row_batches = None
+
+    if csv_path:
+        # Bounded, so a slow CSV writer can't let staged rows pile up
+        row_batches = queue.Queue(maxsize=4)
+        csv_errors = []
+        csv_thread = threading.Thread(
+            target=_csv_worker, args=(row_batches, csv_path, csv_errors), daemon=True,
+        )
+        csv_thread.start()
+
+    # Messages are copied into one preallocated chunk and flushed with a
+    # single write per chunk instead of one write per 36-byte message.
+    # CSV rows are staged alongside and handed to the writer thread per chunk.
+    chunk = bytearray(WRITE_CHUNK_ORDERS * ADD_ORDER_SIZE)
+    view = memoryview(chunk)
+    offset = 0
+
+    try:
+        with open(bin_path, 'wb') as bf:
+            try:
+                for msg_bytes, metadata in orders:
+                    view[offset:offset + ADD_ORDER_SIZE] = msg_bytes
+                    offset += ADD_ORDER_SIZE
+                    if row_batches is not None:
+                        csv_rows.append(metadata)
+                    if offset == len(chunk):
+                        bf.write(chunk)
+                        offset = 0
+                        if row_batches is not None:
+                            row_batches.put(csv_rows)
+                            csv_rows = []
+                    count += 1
+            finally:
+                # Flush the partial chunk even if orders raised, so the binary
+                # file holds the same orders as the CSV rows sent below
+                bf.write(view[:offset])
+    finally:
+        if row_batches is not None:
+            row_batches.put(csv_rows)
+            row_batches.put(None)
+            csv_thread.join()
+
+    if row_batches is not None and csv_errors:
+        raise csv_errors[0]
 
     return count
 
@@ -370,39 +815,71 @@ Examples:
     parser.add_argument('--base-price', type=float, default=150.0,
                         help='Starting price for synthetic data (default: $150.00)')
     parser.add_argument('--seed', type=int, default=42,
-                        help='Random seed for reproducibility (default: 42)')
+                        help='Random seed for reproducibility — important for '
+                             'regression testing (default: 42)')
+    parser.add_argument('--vectorized', action='store_true',
+                        help='Generate synthetic data with NumPy (faster; the '
+                             'same seed gives different data than the default)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Shards for vectorized synthetic generation, each '
+                             'run in its own process; implies --vectorized. The '
+                             'data depends on this count (default: 1)')
 
     args = parser.parse_args()
 
-    # Seed for reproducibility — important for regression testing
-    random.seed(args.seed)
-
     # Validate: must specify either --input or --synthetic
     if not args.input and not args.synthetic:
         parser.error('Must specify either --input (CSV file) or --synthetic')
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    vectorized = args.synthetic and (args.vectorized or args.workers != 1)
+    if vectorized and np is None:
+        parser.error('--vectorized and --workers require NumPy')
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
     if args.csv:
         os.makedirs(os.path.dirname(args.csv) or '.', exist_ok=True)
 
-    # Generate orders
-    if args.synthetic:
-        print(f"Generating {args.num_orders} synthetic ITCH orders...")
-        orders = generate_synthetic(
+    # Generate and write orders. The vectorized generator writes its whole
+    # batch in one go.
+    if vectorized and args.workers != 1:
+        print(f"Generating {args.num_orders} synthetic ITCH orders (vectorized, "
+              f"{_shard_count(args.num_orders, args.workers)} shards)...")
+        count = generate_synthetic_parallel(
+            args.output,
+            args.csv,
             num_orders=args.num_orders,
             symbols=args.symbols,
             base_price=args.base_price,
+            seed=args.seed,
+            workers=args.workers,
         )
+    elif vectorized:
+        print(f"Generating {args.num_orders} synthetic ITCH orders (vectorized)...")
+        msgs, columns = generate_synthetic_batch(
+            num_orders=args.num_orders,
+            symbols=args.symbols,
+            base_price=args.base_price,
+            seed=args.seed,
+        )
+        count = write_batch_output(msgs, columns, args.output, args.csv)
     else:
-        if not Path(args.input).exists():
-            print(f"Error: Input file not found: {args.input}", file=sys.stderr)
-            sys.exit(1)
-        print(f"Generating ITCH orders from CSV: {args.input}")
-        orders = generate_from_csv(args.input)
-
-    # Write output
-    count = write_output(orders, args.output, args.csv)
+        if args.synthetic:
+            print(f"Generating {args.num_orders} synthetic ITCH orders...")
+            orders = generate_synthetic(
+                num_orders=args.num_orders,
+                symbols=args.symbols,
+                base_price=args.base_price,
+                seed=args.seed,
+            )
+        else:
+            if not Path(args.input).exists():
+                print(f"Error: Input file not found: {args.input}", file=sys.stderr)
+                sys.exit(1)
+            print(f"Generating ITCH orders from CSV: {args.input}")
+            orders = generate_from_csv(args.input, seed=args.seed)
+        count = write_output(orders, args.output, args.csv)
 
     # Summary
     file_size = os.path.getsize(args.output)